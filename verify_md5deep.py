@@ -1,13 +1,28 @@
 #!/usr/bin/env python3
 import argparse
+import collections
+import concurrent.futures
 import os
 import shutil
 from pathlib import Path
 import datetime
+import hashlib
 import logging
+import pickle
 import re
+import stat
 import sys
 
+# Below this combined size the two md5deep files are parsed one after the other since starting worker processes
+# would cost more than it saves.
+PARALLEL_PROCESSING_MIN_BYTES = 16 * 1024 * 1024
+
+# Bump this whenever a change to the parsing would make previously cached results wrong.
+CACHE_VERSION = 3
+
+# Matches an md5 hash, or the all-asterisk placeholder openrvdas writes when it doesn't hash a large file.
+MD5_HASH_PATTERN = re.compile(rb'[0-9a-fA-F]{32}|\*{32}')
+
 
 def fix_second(path):
     if not path[0:2] == './':
@@ -32,23 +47,25 @@ def are_paths_similar(path1, path2, cutoff_percentage=0.4):
     - bool: True if the paths are similar based on the given criteria, False otherwise.
     """
     
-    # Find the first point where the strings start matching
-    min_len = min(len(path1), len(path2))
-    
-    match_index = -1
-    for i in range(min_len):
-        if path1[-(i + 1):] == path2[-(i + 1):]:
-            match_index = i
-        else:
-            break
+    return _are_reversed_paths_similar(path1[::-1], path2[::-1], cutoff_percentage)
+
+
+def _are_reversed_paths_similar(path1, path2, cutoff_percentage):
+    """
+    Same as are_paths_similar but takes both paths already reversed so callers comparing one path against many
+    only have to reverse it once.
+    """
+    # Find how long the common ending of the two paths is. The paths are reversed so that's their common prefix
+    # which os.path.commonprefix finds in a single pass.
+    match_length = len(os.path.commonprefix((path1, path2)))
     
     # If no match found at all, return False
-    if match_index == -1:
+    if match_length == 0:
         return False
     
     # Calculate the number of characters to be cut off for each path to match
-    cut1 = len(path1) - match_index - 1
-    cut2 = len(path2) - match_index - 1
+    cut1 = len(path1) - match_length
+    cut2 = len(path2) - match_length
     
     # Calculate the percentage of the path that would be cut off
     perc1 = cut1 / len(path1)
@@ -58,82 +75,227 @@ def are_paths_similar(path1, path2, cutoff_percentage=0.4):
     return perc1 <= cutoff_percentage and perc2 <= cutoff_percentage
 
 
-def subtract_sets_with_similar_paths(set1, set2, ignore_hashes, ignore_paths, cutoff_percentage=0.4):
+def _find_similar_or_exact(path, reversed_candidates, cutoff_percentage):
+    """
+    Helper function to find a path among the candidates that is either similar to or exactly matches the given path.
+    The candidates are the already reversed paths from the comparison set's bucket that the path falls into.
+    """
+    reversed_path1 = path[::-1]
+    length1 = len(reversed_path1)
+    for reversed_path2 in reversed_candidates:
+        # The common suffix can't be longer than the shorter path so if the longer path would already have to lose
+        # more than the cutoff the pair can be skipped without doing the full comparison.
+        longest = max(length1, len(reversed_path2))
+        if longest and (longest - min(length1, len(reversed_path2))) / longest > cutoff_percentage:
+            continue
+        if _are_reversed_paths_similar(reversed_path1, reversed_path2, cutoff_percentage):
+            return True
+    return False
+
+
+def as_path_set(paths):
+    """
+    Returns the paths stored for one hash in a dict from process_file as a set. A hash with a single path has it
+    stored as a plain string rather than in a set of its own to save memory.
     """
-    Compares two sets of (hash, path) pairs and returns the differences between them
+    return {paths} if isinstance(paths, str) else paths
+
+
+def count_files(file_dict):
+    """
+    Returns how many (hash, path) pairs a dict from process_file holds.
+    """
+    return sum(1 if isinstance(paths, str) else len(paths) for paths in file_dict.values())
+
+
+def _group_paths(paths, key):
+    """
+    Groups paths into a dict of sets by the given key function.
+    """
+    groups = collections.defaultdict(set)
+    for path in paths:
+        groups[key(path)].add(path)
+    return groups
+
+
+def _subtract_buckets(buckets1, buckets2, cutoff_percentage):
+    """
+    Compares two dicts that group paths into buckets (a path or a set of paths per key, like the dicts process_file
+    returns), keyed so that similar paths always land in buckets with the same key, and returns the (key, path) pairs
+    on each side with no similar path in the other side's bucket.
+    """
+    unique1 = set()
+    unique2 = set()
+
+    for key, paths1 in buckets1.items():
+        paths1 = as_path_set(paths1)
+        paths2 = buckets2.get(key)
+        # A key that only shows up on one side can't have a match on the other so its paths are unique without any
+        # path comparisons.
+        if paths2 is None:
+            unique1.update((key, path) for path in paths1)
+            continue
+        paths2 = as_path_set(paths2)
+
+        # Paths that appear verbatim on both sides already have an exact match so only the rest need the similarity
+        # search. Those still get searched against the whole of the other bucket since they may be similar to one of its
+        # exact matches. Each bucket's paths are only reversed once no matter how many comparisons they're part of.
+        residual1 = paths1 - paths2
+        residual2 = paths2 - paths1
+        if residual1:
+            reversed_paths2 = [path[::-1] for path in paths2]
+            unique1.update((key, path) for path in residual1
+                           if not _find_similar_or_exact(path, reversed_paths2, cutoff_percentage))
+        if residual2:
+            reversed_paths1 = [path[::-1] for path in paths1]
+            unique2.update((key, path) for path in residual2
+                           if not _find_similar_or_exact(path, reversed_paths1, cutoff_percentage))
+
+    for key, paths2 in buckets2.items():
+        if key not in buckets1:
+            unique2.update((key, path) for path in as_path_set(paths2))
+
+    return unique1, unique2
+
+
+def subtract_sets_with_similar_paths(files1, files2, ignore_hashes, ignore_paths, cutoff_percentage=0.4):
+    """
+    Compares the files listed in two md5deep files and returns the differences between them
     using path similarity instead of direct path comparison.
 
     Parameters:
-    - set1: A set of (hash, path) tuples representing files from the first md5deep file.
-    - set2: A set of (hash, path) tuples representing files from the second md5deep file.
+    - files1: A dict mapping each hash to its path (or set of paths), as returned by process_file for the first md5deep file.
+    - files2: A dict mapping each hash to its path (or set of paths), as returned by process_file for the second md5deep file.
     - cutoff_percentage: The percentage of path that can be chopped off to consider them similar.
 
     Returns:
-    - unique_to_set1: Items unique to set1 based on hash and path similarity.
-    - unique_to_set2: Items unique to set2 based on hash and path similarity.
-    """
-
-    def find_similar_or_exact(item, comparison_set):
-        """
-        Helper function to find a file in the comparison_set that either has the same hash and similar path,
-        or exactly matches both hash and path.
-        """
-        for other_item in comparison_set:
-            hash1, path1 = item
-            hash2, path2 = other_item
-            if ignore_hashes:
-                if are_paths_similar(path1, path2, cutoff_percentage):
-                    return True
-            elif ignore_paths:
-                if hash1 == hash2:
-                    return True
-            else:
-                if hash1 == hash2 and are_paths_similar(path1, path2, cutoff_percentage):
-                    return True
-        return False
+    - unique_to_files1: (hash, path) pairs unique to files1 based on hash and path similarity.
+    - unique_to_files2: (hash, path) pairs unique to files2 based on hash and path similarity.
+    """
 
-    # Find items in set1 that are not in set2
-    unique_to_set1 = {item for item in set1 if not find_similar_or_exact(item, set2)}
+    if ignore_paths:
+        # Only the hashes matter so comparing the keys of the two dicts is all that's needed.
+        unique_to_files1 = {(hash1, path) for hash1 in files1.keys() - files2.keys() for path in as_path_set(files1[hash1])}
+        unique_to_files2 = {(hash2, path) for hash2 in files2.keys() - files1.keys() for path in as_path_set(files2[hash2])}
+        return unique_to_files1, unique_to_files2
+
+    if ignore_hashes:
+        # Only the paths matter so regroup them by basename instead of by hash. Unless a path is mostly basename (so that
+        # cutting off everything before the basename would stay within the cutoff) any path similar to it has to share
+        # more than its basename as a common suffix, separator included, so has the same basename.
+        paths1 = {path for paths in files1.values() for path in as_path_set(paths)}
+        paths2 = {path for paths in files2.values() for path in as_path_set(paths)}
+        unique1, unique2 = _subtract_buckets(_group_paths(paths1, os.path.basename),
+                                             _group_paths(paths2, os.path.basename), cutoff_percentage)
+
+        # Two paths that are both mostly basename can be similar with different basenames (e.g. "./a_long_name.txt"
+        # and "./b_long_name.txt") so those get a second chance at a match by path suffix instead. Similar paths
+        # always share at least (1 - cutoff_percentage) of the shorter path as a common suffix so bucketing on a suffix
+        # of that length (minus one to stay clear of float rounding) never separates two similar paths.
+        def is_mostly_basename(path):
+            return path and (len(path) - len(os.path.basename(path))) / len(path) <= cutoff_percentage
+
+        long_paths1 = {path for _, path in unique1 if is_mostly_basename(path)}
+        long_paths2 = {path for _, path in unique2 if is_mostly_basename(path)}
+        if long_paths1 or long_paths2:
+            all_long_paths1 = {path for path in paths1 if is_mostly_basename(path)}
+            all_long_paths2 = {path for path in paths2 if is_mostly_basename(path)}
+            key_length = max(1, int((1 - cutoff_percentage) * min(map(len, all_long_paths1 | all_long_paths2))) - 1)
+            long_unique1, long_unique2 = _subtract_buckets(_group_paths(all_long_paths1, lambda path: path[-key_length:]),
+                                                           _group_paths(all_long_paths2, lambda path: path[-key_length:]),
+                                                           cutoff_percentage)
+            matched_by_suffix1 = long_paths1 - {path for _, path in long_unique1}
+            matched_by_suffix2 = long_paths2 - {path for _, path in long_unique2}
+            unique1 = {(key, path) for key, path in unique1 if path not in matched_by_suffix1}
+            unique2 = {(key, path) for key, path in unique2 if path not in matched_by_suffix2}
+
+        unique_paths1 = {path for _, path in unique1}
+        unique_paths2 = {path for _, path in unique2}
+        unique_to_files1 = {(hash1, path) for hash1, paths in files1.items() for path in as_path_set(paths) if path in unique_paths1}
+        unique_to_files2 = {(hash2, path) for hash2, paths in files2.items() for path in as_path_set(paths) if path in unique_paths2}
+    else:
+        # Files are already grouped by hash and a file can only match one with the same hash.
+        unique_to_files1, unique_to_files2 = _subtract_buckets(files1, files2, cutoff_percentage)
+
+    return unique_to_files1, unique_to_files2
+
+
+def compile_path_patterns(pattern_list):
+    """
+    Combines a list of path regexes into one alternation so a path is checked against all of them in a single search.
 
-    # Find items in set2 that are not in set1
-    unique_to_set2 = {item for item in set2 if not find_similar_or_exact(item, set1)}
+    Returns a function that takes a path and returns a truthy value if any of the patterns match it, or None if
+    pattern_list is empty.
+    """
+    if not pattern_list:
+        return None
 
-    return unique_to_set1, unique_to_set2
+    patterns = [re.compile(pattern) for pattern in pattern_list]
+    # Joining the patterns renumbers their groups, which would leave numbered backreferences (which always need a
+    # group to refer to) pointing at the wrong one. Global flags like (?i) would either be rejected (Python 3.11+) or
+    # apply to every pattern in the alternation (earlier versions). Patterns with either are searched with separately.
+    default_flags = re.compile('').flags
+    if not any(pattern.groups or pattern.flags != default_flags for pattern in patterns):
+        try:
+            return re.compile('|'.join(f'(?:{pattern})' for pattern in pattern_list)).search
+        except re.error:
+            # Fall back to searching with each pattern separately.
+            pass
+
+    return lambda path: any(pattern.search(path) for pattern in patterns)
 
 
 def process_file(file_name, excluded_pairs, ignore_hashes_set, exclude_path_list=None, include_path_list=None):
-    file_set = set()
-    with open(file_name) as f:
+    # Files are grouped by hash since that's how they're looked up when comparing. Almost every hash belongs to a single
+    # file so it maps straight to that file's path; only when the same file content shows up in more than one place
+    # does it map to a set of paths instead.
+    file_dict = {}
+    exclude_path_search = compile_path_patterns(exclude_path_list)
+    include_path_search = compile_path_patterns(include_path_list)
+    # Read the file as raw bytes and only decode the hash and path of lines that match one of the known formats.
+    with open(file_name, 'rb') as f:
         for line in f:
-            split_1 = line.split(',') # This variable be a list of substrings of the line separated by commas (not including the commas).
-            split_2 = line.split() # This variable is useful for manifest files that contain only two columns (hash, filepath) separated by a space or multiple spaces.
-
             # Determine which format of md5deep file we are dealing with and construct (hash, filepath) pairs for each line accordingly.
+            commas = line.count(b',')
             # This is the regular md5deep format that you get by running the md5deep command. 
-            if len(split_1) == 4:
-                pair = (split_1[1].strip(), split_1[3].strip())
-            # Distros in the OpenVDM/OpenRVDAS format will have an md5deep file called "md5_summary.txt"
-            # and these are different because they don't only have 2 columns.
-            elif len(split_2) == 4: # this is a new format! WHOI is sending space delimited files with 4 columns
-                pair = (split_2[1].strip(), split_2[3].strip())
-            elif len(split_2) == 2:
-                pair = (split_2[0].strip(), split_2[1].strip())
-            # edu.washington have started creating md5deep files. They're format contains 3 columns (file size, hash, absolute path). These look similar to the 4-column md5deep files except they're missing the date column. The delimiter for both is a comma.
-            elif len(split_1) == 3:
-                pair = (split_1[1].strip(), split_1[2].strip())
+            if commas == 3:
+                fields = line.split(b',')
+                hash_field, path_field = fields[1].strip(), fields[3].strip()
             else:
-                # If we've not found either 2 or 4 commas then I don't recognize this manifest file so just skip this line.
-                continue
-
-            if exclude_path_list:
+                # Manifest files that contain only two columns (hash, filepath) separated by a space or multiple spaces.
+                # The filepath is everything after the hash so filepaths with spaces in them come through whole. Those
+                # can't be told apart from the other whitespace delimited formats by counting columns so it's the
+                # leading md5 (or all-asterisk) hash that identifies them.
+                fields = line.split(None, 1)
+                if len(fields) == 2 and MD5_HASH_PATTERN.fullmatch(fields[0]):
+                    hash_field, path_field = fields[0], fields[1].rstrip()
+                else:
+                    fields = line.split()
+                    # Distros in the OpenVDM/OpenRVDAS format will have an md5deep file called "md5_summary.txt"
+                    # and these are different because they don't only have 2 columns.
+                    if len(fields) == 4: # this is a new format! WHOI is sending space delimited files with 4 columns
+                        hash_field, path_field = fields[1], fields[3]
+                    elif len(fields) == 2:
+                        hash_field, path_field = fields[0], fields[1]
+                    # edu.washington have started creating md5deep files. They're format contains 3 columns (file size, hash, absolute path). These look similar to the 4-column md5deep files except they're missing the date column. The delimiter for both is a comma.
+                    elif commas == 2:
+                        fields = line.split(b',')
+                        hash_field, path_field = fields[1].strip(), fields[2].strip()
+                    else:
+                        # If we've not found either 2 or 4 commas then I don't recognize this manifest file so just skip this line.
+                        continue
+
+            pair = (hash_field.decode(), path_field.decode())
+
+            if exclude_path_search:
                 # Check if any regex pattern in the list matches the path (pair[1])
-                if any(re.search(pattern, pair[1]) for pattern in exclude_path_list):
+                if exclude_path_search(pair[1]):
                     excluded_pairs.append(pair)
                     continue
 
-            if include_path_list:
+            if include_path_search:
                 # Check if the path is included in the include_path_list regex. If not then don't add the pair for consideration.
-                if not (any(re.search(pattern, pair[1]) for pattern in include_path_list)):
+                if not include_path_search(pair[1]):
                     excluded_pairs.append(pair)
                     continue
 
@@ -142,9 +304,73 @@ def process_file(file_name, excluded_pairs, ignore_hashes_set, exclude_path_list
                excluded_pairs.append(pair) 
                continue
 
-            file_set.add(pair)
+            paths = file_dict.get(pair[0])
+            if paths is None:
+                file_dict[pair[0]] = pair[1]
+            elif isinstance(paths, str):
+                if paths != pair[1]:
+                    file_dict[pair[0]] = {paths, pair[1]}
+            else:
+                paths.add(pair[1])
+
+    return file_dict
+
+
+def process_file_with_exclusions(file_name, ignore_hashes_set, exclude_path_list=None, include_path_list=None, use_cache=False):
+    """
+    Runs process_file and returns the excluded pairs alongside the file dict instead of appending them to a
+    caller-supplied list, which wouldn't survive the trip back from a worker process.
 
-    return file_set
+    If use_cache is set the result is saved to disk and reused on later runs for as long as the file's modification
+    time and size stay the same. Only regular files are cached: pipes (e.g. from process substitution) always report a
+    size of 0 and their paths get reused, so there's nothing to tell one pipe's contents from another's.
+    """
+    file_stat = os.stat(file_name)
+    use_cache = use_cache and stat.S_ISREG(file_stat.st_mode)
+
+    if use_cache:
+        cache_file = get_cache_file(file_name, ignore_hashes_set, exclude_path_list, include_path_list)
+        try:
+            version, mtime_ns, size, file_dict, excluded_pairs = pickle.loads(cache_file.read_bytes())
+            if ((version, mtime_ns, size) == (CACHE_VERSION, file_stat.st_mtime_ns, file_stat.st_size)
+                    and isinstance(file_dict, dict) and isinstance(excluded_pairs, list)):
+                return file_dict, excluded_pairs
+        except Exception:
+            # The cache is only there to save time so anything wrong with it (missing, unreadable, truncated, corrupt
+            # or from an older version) just means the md5deep file gets parsed again.
+            pass
+
+    excluded_pairs = []
+    file_dict = process_file(file_name, excluded_pairs, ignore_hashes_set, exclude_path_list, include_path_list)
+
+    if use_cache:
+        # Write to a temporary file first so a run that's interrupted never leaves a half-written cache behind.
+        temp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_bytes(pickle.dumps((CACHE_VERSION, file_stat.st_mtime_ns, file_stat.st_size, file_dict, excluded_pairs),
+                                               protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logging.warning(f'Could not cache the parsed contents of {file_name}: {e}')
+            # Don't leave a partly written temporary file behind (e.g. when the disk filled up).
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
+    return file_dict, excluded_pairs
+
+
+def get_cache_file(file_name, ignore_hashes_set, exclude_path_list=None, include_path_list=None):
+    """
+    Returns the path of the file that the parsed contents of the given md5deep file are cached in. Each md5deep file
+    (and combination of options that change how it's parsed) gets one cache file that's overwritten whenever the
+    md5deep file changes.
+    """
+    key = repr((os.path.realpath(file_name), bool(ignore_hashes_set), exclude_path_list, include_path_list))
+    cache_dir = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'verify_md5deep'
+    return cache_dir / f'{hashlib.sha1(key.encode()).hexdigest()}.pkl'
 
 
 def main():
@@ -163,6 +389,9 @@ def main():
                         help='list of regexes where if a filepath matches any of them it is not included in the comparisons.')
     parser.add_argument('--include-path-list', nargs='+', metavar='pattern',
                         help='list of regexes where a filepath must match at least one to be included in the comparisons.')
+    parser.add_argument('--cache', action='store_true',
+                        help='cache the parsed md5deep files under ~/.cache/verify_md5deep and reuse them on later runs. '
+                             'Cache files are never deleted automatically.')
     args = parser.parse_args()
 
     date = datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
@@ -181,20 +410,29 @@ def main():
     file1_pair_exclusion_list = [] # This variable tracks the number of files in file 1 who's hash is all asterisks (these hashes are created by openrvdas when it doesn't want to generate hash for a large file.
     file2_pair_exclusion_list = []
    
-    set1 = process_file(args.file1, file1_pair_exclusion_list, args.ignore_hashes, args.exclude_path_list, args.include_path_list)
-    set2 = process_file(args.file2, file2_pair_exclusion_list, args.ignore_hashes, args.exclude_path_list, args.include_path_list)
+    if (os.cpu_count() or 1) > 1 and os.path.getsize(args.file1) + os.path.getsize(args.file2) >= PARALLEL_PROCESSING_MIN_BYTES:
+        # Parsing is CPU bound so large files are parsed side by side, each in its own process. With a single CPU
+        # there's nothing to overlap and sending the results back from the workers only adds time.
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(process_file_with_exclusions, args.file1, args.ignore_hashes, args.exclude_path_list, args.include_path_list, args.cache)
+            future2 = executor.submit(process_file_with_exclusions, args.file2, args.ignore_hashes, args.exclude_path_list, args.include_path_list, args.cache)
+            files1, file1_pair_exclusion_list = future1.result()
+            files2, file2_pair_exclusion_list = future2.result()
+    else:
+        files1, file1_pair_exclusion_list = process_file_with_exclusions(args.file1, args.ignore_hashes, args.exclude_path_list, args.include_path_list, args.cache)
+        files2, file2_pair_exclusion_list = process_file_with_exclusions(args.file2, args.ignore_hashes, args.exclude_path_list, args.include_path_list, args.cache)
 
     print("\n--------------BEGIN VERIFY_MD5DEEP REPORT-------------\n")
 
-    #if len(set1) == len(set2) and set1 == set2:
+    #if len(files1) == len(files2) and files1 == files2:
     #    print(f'{args.file1} and {args.file2} are the same.')
     #else:
-    unique_to_set1, unique_to_set2 = subtract_sets_with_similar_paths(set1, set2, args.ignore_hashes, args.ignore_paths)
+    unique_to_files1, unique_to_files2 = subtract_sets_with_similar_paths(files1, files2, args.ignore_hashes, args.ignore_paths)
     # If the user hasn't specified that they want only file 2 results shown then display file 1 results.
     if args.c != 2:
-        for count, item in enumerate(unique_to_set2, 1):
-            print(f'pair #{count} missing from {args.file1}: {item}')
-        if len(unique_to_set2) == 0:
+        # Build the per-pair lines up front and write them out in one go rather than printing them one at a time.
+        sys.stdout.write(''.join(f'pair #{count} missing from {args.file1}: {item}\n' for count, item in enumerate(unique_to_files2, 1)))
+        if len(unique_to_files2) == 0:
             print(f'{args.file1} is not missing any files from {args.file2}.')
 
     if not args.c:
@@ -202,18 +440,20 @@ def main():
 
     # If the user hasn't specified that they want only file 1 results shown then display file 2 results.
     if args.c != 1:
-        for count, item in enumerate(unique_to_set1, 1):
-            print(f'pair #{count} missing from {args.file2}: {item}')
-        if len(unique_to_set1) == 0:
+        sys.stdout.write(''.join(f'pair #{count} missing from {args.file2}: {item}\n' for count, item in enumerate(unique_to_files1, 1)))
+        if len(unique_to_files1) == 0:
             print(f'{args.file2} is not missing any files from {args.file1}.')
 
     print("\n----------------------FINAL TALLY----------------------\n")
 
+    file_count1 = count_files(files1)
+    file_count2 = count_files(files2)
+
     if args.c != 2:
-        print(f'{args.file1} contains {len(set1)} files and is missing {len(unique_to_set2)} of the {len(set2)} file(s) that {args.file2} has.') 
+        print(f'{args.file1} contains {file_count1} files and is missing {len(unique_to_files2)} of the {file_count2} file(s) that {args.file2} has.') 
 
     if args.c != 1:
-        print(f'{args.file2} contains {len(set2)} files and is missing {len(unique_to_set1)} of the {len(set1)} file(s) that {args.file1} has.')
+        print(f'{args.file2} contains {file_count2} files and is missing {len(unique_to_files1)} of the {file_count1} file(s) that {args.file1} has.')
 
     print("\n----------------------NOTES----------------------\n")
     